@@ -4,10 +4,380 @@
 #  the integers or the radix-point numbers.
 
 from __future__ import annotations
+import functools
+import math
+import operator
 import numpy as np
+from numba import njit, prange
 from tools import check_objects, check_array, unit_inv
 
 
+## Length of the coefficient arrays below which Karatsuba multiplication falls back
+#  to the schoolbook convolution
+_KARATSUBA_THRESHOLD = 48
+
+## Degree of the product above which the multiplication is done with the fast Fourier
+#  transform (if the floating point precision suffices)
+_FFT_THRESHOLD = 512
+
+## Primes of the form c * 2^k + 1 used by the number-theoretic transform. All of them have 
+#  3 as a primitive root and support transforms of length up to 2^23. Since the primes are 
+#  less than 2^30 the products of two residues fit into 64-bit integers
+_NTT_PRIMES = (998244353, 167772161, 469762049)
+_NTT_ROOT = 3
+_NTT_MAX_LEN = 1 << 23
+
+## Degree of the product above which the multiplication is done with the number-theoretic
+#  transform when the fast Fourier transform is not precise enough. Below it Karatsuba is
+#  faster (measured with a single thread to break even at around 1.5 * 10^4 coefficients 
+#  per factor; more threads only favour the transform)
+_NTT_THRESHOLD = 1 << 15
+
+
+## Schoolbook convolution of two coefficient arrays. The result is not reduced modulo
+#  any base
+#  @param a The first coefficient array
+#  @param b The second coefficient array
+#  @param out The array where the convolution is written. Should be of length 
+#   len(a) + len(b) - 1
+@njit(cache=True)
+def _convolve(a: np.ndarray[np.int64], b: np.ndarray[np.int64], out: np.ndarray[np.int64]) -> None:
+    out[:] = 0
+
+    for i in range(len(a)):
+        for j in range(len(b)):
+            out[i + j] += a[i] * b[j]
+
+
+## Schoolbook multiplication of two coefficient arrays. Each coefficient of the product is
+#  accumulated in a register and split into the coefficient and the carry right away, so
+#  that the unreduced convolution is never written to memory
+#  @param a The first coefficient array
+#  @param b The second coefficient array
+#  @param base The base used in computations
+#  @param out The array where the coefficients of the product are written. Should be of 
+#   length len(a) + len(b) - 1
+#  @param carries The array where the carries of the product are written. Should be of 
+#   length len(a) + len(b) and have the first element set to zero
+@njit(cache=True)
+def _mul_schoolbook(a: np.ndarray[np.int64], b: np.ndarray[np.int64], base: int, 
+                    out: np.ndarray[np.int64], carries: np.ndarray[np.int64]) -> None:
+    n, m = len(a), len(b)
+
+    for i in range(n + m - 1):
+        acc = 0
+
+        for j in range(max(0, i - m + 1), min(i, n - 1) + 1):
+            acc += a[j] * b[i - j]
+
+        out[i] = acc % base
+        carries[i + 1] = acc // base
+
+
+## Size of the scratch array needed by _karatsuba for arrays of length n. Each level of 
+#  the recursion needs 4 * ceil(n / 2) - 1 elements for the sums of the halves and their
+#  product, and the recursive calls reuse the space after them
+#  @param n The length of the multiplied arrays
+def _karatsuba_scratch_size(n: int) -> int:
+    size = 0
+
+    while n > _KARATSUBA_THRESHOLD:
+        n -= n // 2
+        size += 4 * n - 1
+
+    return size
+
+
+## Recursive Karatsuba multiplication of two coefficient arrays of equal length. The
+#  product is not reduced modulo the base so that the reduction (and the computation 
+#  of the carries) can be done once at the very end. No arrays are allocated during 
+#  the recursion; all temporaries live in the preallocated scratch array
+#  @param a The first coefficient array
+#  @param b The second coefficient array. Should be of the same length as the first one
+#  @param out The array where the product is written. Should be of length 2 * len(a) - 1
+#  @param scratch Workspace of at least _karatsuba_scratch_size(len(a)) elements
+@njit(cache=True)
+def _karatsuba(a: np.ndarray[np.int64], b: np.ndarray[np.int64], 
+               out: np.ndarray[np.int64], scratch: np.ndarray[np.int64]) -> None:
+    n = len(a)
+
+    if n <= _KARATSUBA_THRESHOLD:
+        _convolve(a, b, out)
+        return
+
+    # Split as a = a0 + a1 * x^k and b = b0 + b1 * x^k. The high halves of length h 
+    # are at least as long as the low halves
+    k = n // 2
+    h = n - k
+
+    # z0 = a0 * b0 and z2 = a1 * b1 are written directly to their places in the output
+    _karatsuba(a[:k], b[:k], out[:2 * k - 1], scratch)
+    out[2 * k - 1] = 0
+    _karatsuba(a[k:], b[k:], out[2 * k:], scratch)
+
+    a_sum = scratch[:h]
+    b_sum = scratch[h:2 * h]
+    z1 = scratch[2 * h:4 * h - 1]
+
+    a_sum[:] = a[k:]
+    a_sum[:k] += a[:k]
+    b_sum[:] = b[k:]
+    b_sum[:k] += b[:k]
+
+    _karatsuba(a_sum, b_sum, z1, scratch[4 * h - 1:])
+
+    # z1 - z0 - z2 is the coefficient of x^k
+    z1 -= out[2 * k:]
+    z1[:2 * k - 1] -= out[:2 * k - 1]
+    out[k:k + 2 * h - 1] += z1
+
+
+## Computes x^e modulo p with repeated squaring
+@njit(cache=True)
+def _pow_mod(x: int, e: int, p: int) -> int:
+    res = 1
+    x %= p
+
+    while e > 0:
+        if e & 1:
+            res = res * x % p
+        
+        x = x * x % p
+        e >>= 1
+
+    return res
+
+
+## Powers of a primitive n:th root of unity modulo a prime used by _ntt
+#  @param n The length of the transform. Should be a power of two
+#  @param p The prime modulus. Should be one of _NTT_PRIMES
+#  @param inverse Boolean flag for computing the roots of the inverse transform instead
+@njit(cache=True)
+def _ntt_roots(n: int, p: int, inverse: bool) -> np.ndarray[np.int64]:
+    root = _pow_mod(_NTT_ROOT, (p - 1) // n, p)
+    if inverse:
+        root = _pow_mod(root, p - 2, p)
+
+    roots = np.ones(max(n // 2, 1), dtype=np.int64)
+    for i in range(1, n // 2):
+        roots[i] = roots[i - 1] * root % p
+
+    return roots
+
+
+## Single butterfly of the number-theoretic transform. Only the twiddle multiplication
+#  needs a modular reduction; the sum and the difference are corrected with a subtraction
+@njit(cache=True)
+def _ntt_butterfly(a: np.ndarray[np.int64], i: int, j: int, w: int, p: int) -> None:
+    u = a[i]
+    v = a[j] * w % p
+
+    s = u + v
+    if s >= p:
+        s -= p
+
+    d = u - v
+    if d < 0:
+        d += p
+
+    a[i] = s
+    a[j] = d
+
+
+## In-place iterative radix-2 number-theoretic transform modulo a prime
+#  @param a The array to transform. The length should be a power of two
+#  @param p The prime modulus. Should be one of _NTT_PRIMES
+#  @param roots The powers of the root of unity as given by _ntt_roots(len(a), p, inverse)
+#  @param inverse Boolean flag for computing the inverse transform instead
+@njit(cache=True, parallel=True)
+def _ntt(a: np.ndarray[np.int64], p: int, roots: np.ndarray[np.int64], inverse: bool) -> None:
+    n = len(a)
+
+    # Bit-reversal permutation
+    j = 0
+    for i in range(1, n):
+        bit = n // 2
+
+        while j & bit:
+            j ^= bit
+            bit >>= 1
+
+        j ^= bit
+
+        if i < j:
+            a[i], a[j] = a[j], a[i]
+
+    # The stage with blocks of length l uses every (n / l):th root. The parallel loop 
+    # is over the blocks in the early stages and within the blocks in the late ones
+    length = 2
+    while length <= n:
+        half = length // 2
+        step = n // length
+
+        if step >= half:
+            for block in prange(step):
+                start = block * length
+
+                for k in range(half):
+                    _ntt_butterfly(a, start + k, start + k + half, roots[k * step], p)
+        else:
+            for start in range(0, n, length):
+                for k in prange(half):
+                    _ntt_butterfly(a, start + k, start + k + half, roots[k * step], p)
+
+        length *= 2
+
+    if inverse:
+        n_inv = _pow_mod(n, p - 2, p)
+
+        for i in prange(n):
+            a[i] = a[i] * n_inv % p
+
+
+## Exact convolution of two coefficient arrays with the number-theoretic transform. The 
+#  convolution is computed modulo each of the _NTT_PRIMES and combined with the Chinese 
+#  remainder theorem (Garner's algorithm)
+#  @param a The first coefficient array
+#  @param b The second coefficient array
+#  @param bound Bound for the absolute values of the convolution. Should be less than 2^62
+#  @return The convolution, not reduced modulo any base
+@njit(cache=True)
+def _ntt_convolve(a: np.ndarray[np.int64], b: np.ndarray[np.int64], 
+                  bound: int) -> np.ndarray[np.int64]:
+    new_len = len(a) + len(b) - 1
+    n = 1
+    while n < new_len:
+        n *= 2
+
+    residues = np.empty((3, new_len), dtype=np.int64)
+
+    for i in range(3):
+        p = _NTT_PRIMES[i]
+
+        # The root tables are shared by the three transforms modulo the same prime
+        roots = _ntt_roots(n, p, False)
+        inv_roots = _ntt_roots(n, p, True)
+
+        a_hat = np.zeros(n, dtype=np.int64)
+        a_hat[:len(a)] = a % p
+        b_hat = np.zeros(n, dtype=np.int64)
+        b_hat[:len(b)] = b % p
+
+        _ntt(a_hat, p, roots, False)
+        _ntt(b_hat, p, roots, False)
+        a_hat = a_hat * b_hat % p
+        _ntt(a_hat, p, inv_roots, True)
+
+        # Shift by the bound so that the reconstructed value is non-negative
+        residues[i] = (a_hat[:new_len] + bound) % p
+
+    p1, p2, p3 = _NTT_PRIMES
+    inv_p1 = _pow_mod(p1, p2 - 2, p2)
+    inv_p1p2 = _pow_mod(p1 * p2 % p3, p3 - 2, p3)
+
+    r1, r2, r3 = residues[0], residues[1], residues[2]
+    t2 = (r2 - r1) % p2 * inv_p1 % p2
+    t3 = (r3 - r1 - p1 * t2 % p3) % p3 * inv_p1p2 % p3
+
+    return r1 + p1 * t2 + p1 * p2 * t3 - bound
+
+
+## Schoolbook long division of two coefficient arrays
+#  @param a The coefficient array of the dividend
+#  @param b The coefficient array of the divisor. The last element should be the 
+#   (non-zero) leading coefficient
+#  @param base The base used in computations
+#  @param inv_lc The inverse of the leading coefficient of the divisor modulo base
+#  @return Tuple of the coefficients of the quotient and the remainder
+@njit(cache=True)
+def _div_schoolbook(a: np.ndarray[np.int64], b: np.ndarray[np.int64], base: int, 
+                    inv_lc: int) -> tuple[np.ndarray[np.int64], np.ndarray[np.int64]]:
+    n, m = len(a), len(b)
+
+    if n < m:
+        return np.zeros(1, dtype=np.int64), a.copy()
+
+    # The remainder is updated in place in a single buffer and is reduced modulo base
+    # only when a coefficient becomes the leading one. Each coefficient is subtracted 
+    # from at most m times so the unreduced values stay below m * base^2
+    q = np.zeros(n - m + 1, dtype=np.int64)
+    r = a.copy()
+
+    for i in range(n - m, -1, -1):
+        d = ((r[i + m - 1] % base) * inv_lc) % base
+
+        if d == 0:
+            continue
+
+        # Subtract d * x^i * b by shifting the divisor i positions. The leading 
+        # coefficient is eliminated by construction so it can be skipped
+        q[i] = d
+
+        for j in range(m - 1):
+            r[i + j] -= d * b[j]
+
+    return q, r[:m - 1] % base
+
+
+## Packs the coefficients of a binary polynomial into 64-bit words so that the 
+#  coefficient of x^i is the bit i % 64 of the word i // 64
+#  @param coefs The coefficient array. Coefficients are taken modulo 2
+def _gf2_pack(coefs: np.ndarray[np.int64]) -> np.ndarray[np.uint64]:
+    packed = np.packbits((coefs & 1).astype(np.uint8), bitorder="little")
+    packed = np.pad(packed, (0, -len(packed) % 8))
+
+    return packed.view("<u8")
+
+
+## Inverse of _gf2_pack
+#  @param words The packed coefficients
+#  @param n The number of coefficients to unpack
+def _gf2_unpack(words: np.ndarray[np.uint64], n: int) -> np.ndarray[np.int64]:
+    return np.unpackbits(words.view(np.uint8), count=n, bitorder="little").astype(np.int64)
+
+
+## Long division of two binary polynomials packed with _gf2_pack. Over GF(2) the 
+#  subtraction of the shifted divisor is a XOR so each word operation handles 64
+#  coefficients at once
+#  @param a The packed coefficients of the dividend
+#  @param n The number of coefficients in the dividend
+#  @param b The packed coefficients of the divisor
+#  @param m The number of coefficients in the divisor. The coefficient of x^(m - 1) 
+#   should be one
+#  @return Tuple of the packed quotient and the packed remainder
+@njit(cache=True)
+def _gf2_div(a: np.ndarray[np.uint64], n: int, b: np.ndarray[np.uint64], 
+             m: int) -> tuple[np.ndarray[np.uint64], np.ndarray[np.uint64]]:
+    one = np.uint64(1)
+
+    # Precompute the divisor shifted by each possible bit offset within a word
+    n_words = len(b) + 1
+    shifted = np.zeros((64, n_words), dtype=np.uint64)
+
+    for s in range(64):
+        for k in range(len(b)):
+            shifted[s, k] |= b[k] << np.uint64(s)
+
+            if s > 0:
+                shifted[s, k + 1] |= b[k] >> np.uint64(64 - s)
+
+    q = np.zeros((n - m) // 64 + 1, dtype=np.uint64)
+    r = np.zeros(len(a) + n_words, dtype=np.uint64)
+    r[:len(a)] = a
+
+    for i in range(n - m, -1, -1):
+        lead = i + m - 1
+
+        if (r[lead // 64] >> np.uint64(lead % 64)) & one:
+            q[i // 64] |= one << np.uint64(i % 64)
+
+            w, s = i // 64, i % 64
+            for k in range(n_words):
+                r[w + k] ^= shifted[s, k]
+
+    return q, r
+
+
 ## The Polynomial class is used to represent univariate polynomials. These can be considered
 #  to be on a ring \$\mathbb{Z}_p\$ (that is integers modulo \$p\$). 
 #
@@ -16,7 +386,9 @@ from tools import check_objects, check_array, unit_inv
 #  While the algorithms themselves should run in near linear time, Python (even with help from Numpy)
 #  is not all that fast and doesn't allow low level optimizations. Additionally, the implementation
 #  is not the most memory efficient as the coefficients of the polynomial will be stored as 64-bit
-#  (or 32-bit if ran on 32-bit architecture) integers in a Numpy array.
+#  integers in a contiguous Numpy array. Because of this the base should be small enough that 
+#  the unreduced coefficients of a product, at most n * (base - 1)^2 for n coefficients, fit 
+#  into a 64-bit integer.
 class Polynomial:
 
     ## The standard constructor
@@ -26,29 +398,59 @@ class Polynomial:
     #  @param base The base used in computations. Optional and defaults to 10.
     #  @param reverse Boolean flag for reversing the array. Optional and defaults to False. If the array 
     #   contains the coefficients in decreasing order of power the array can be reversed with this flag.
+    #  @param carries The array of carries. Optional and defaults to None.
+    #  @param deg The degree of the polynomial if already known. Optional and defaults to None. If
+    #   passed, the coefficient at index deg should be non-zero (unless deg is 0) and the trailing zeros 
+    #   are not searched for. Note that in this case the coefficient array is not copied, so it should
+    #   not be used by the caller afterwards.
     @check_array
     def __init__(self, coefs: np.ndarray[np.int64], base: int = 10, 
                                                     reverse: bool = False, 
-                                                    carries: np.ndarray[np.int64] = None) -> None:
-        self.__coefs = np.array(coefs)
-        self.__base = base
+                                                    carries: np.ndarray[np.int64] = None,
+                                                    deg: int = None) -> None:
+        # Arrays coming from the user are copied so that the polynomial does not share memory
+        # with them. Internal constructors that know the degree pass freshly allocated arrays
+        if deg is None:
+            self._coefs = np.array(coefs, dtype=np.int64)
+        else:
+            self._coefs = np.ascontiguousarray(coefs, dtype=np.int64)
 
-        if reverse:
-            self.__coefs = np.flip(self.__coefs)
+            # The checks are skipped when Python is ran with the -O flag
+            if __debug__:
+                assert 0 <= deg < len(self._coefs), f"The degree must index the coefficient array! (deg: {deg})"
+                assert deg == 0 or self._coefs[deg] != 0, "The coefficient at the given degree must be non-zero!"
 
-        # Remove trailing zeros to find valid degree and leading coefficient
-        self.__coefs = np.trim_zeros(self.__coefs, 'b')
+        self._base = base
 
-        self.__deg = len(self.__coefs) - 1
-        self.__lc = self.__coefs[-1] if self.__deg > 0 else 0
+        if reverse:
+            self._coefs = np.ascontiguousarray(np.flip(self._coefs))
+
+        # Remove trailing zeros to find valid degree and leading coefficient. The zero
+        # polynomial is stored as a single zero coefficient. If the degree is known the
+        # search is skipped and the array is only sliced (without copying)
+        if deg is None:
+            nonzero = np.flatnonzero(self._coefs)
+            deg = int(nonzero[-1]) if nonzero.size > 0 else -1
+
+        if deg < 0:
+            self._coefs = np.zeros(1, dtype=np.int64)
+            self._deg = 0
+            self._lc = 0
+        else:
+            self._coefs = self._coefs[:deg + 1]
+            self._deg = int(deg)
+            self._lc = self._coefs[deg]
 
         # Additionally, we will store the carries in a separate array that is not yet defined
-        self.__carries = carries
+        self.__carries = np.ascontiguousarray(carries, dtype=np.int64) if carries is not None else None
+
+        # The hash is computed lazily from the raw bytes of the coefficients and cached
+        self.__hash = None
 
 
     ## The object representation for debugging purposes. Call with repr() built-in function
     def __repr__(self) -> str:
-        return f"coefs: {self.__coefs}\ncarries: {self.__carries}\nbase: {self.__base}"
+        return f"coefs: {self._coefs}\ncarries: {self.__carries}\nbase: {self._base}"
     
 
 
@@ -58,14 +460,17 @@ class Polynomial:
     
 
     def __hash__(self) -> int:
-        return hash(repr(self))
+        if self.__hash is None:
+            self.__hash = hash((self._coefs.tobytes(), int(self._base)))
+
+        return self.__hash
     
 
     def __copy__(self) -> Polynomial:
         if self.__carries is not None:
-            return Polynomial(self.__coefs.copy(), base=self.__base, carries=self.__carries.copy())
+            return Polynomial(self._coefs.copy(), base=self._base, carries=self.__carries.copy(), deg=self._deg)
         else:
-            return Polynomial(self.__coefs.copy(), base=self.__base)
+            return Polynomial(self._coefs.copy(), base=self._base, deg=self._deg)
     
 
     def copy(self) -> Polynomial:
@@ -75,14 +480,14 @@ class Polynomial:
     #  @param x The point of evaluation. Optional and if not passed the polynomial
     #  will be evaluated at the base
     def __call__(self, x: int = None) -> str:
-        return sum([self.__coefs[i] * (x ** i) for i in range(self.__deg + 1)]) % self.__base
+        return sum([self._coefs[i] * (x ** i) for i in range(self._deg + 1)]) % self._base
 
     ## Get an individual coefficient from the coefficient array
     #  @param key The key by which coefficient is accessed. Should be the index of
     #   the coefficient
     def __getitem__(self, key: int) -> int:
-        if key <= self.__deg:
-            return self.__coefs[key]
+        if key <= self._deg:
+            return self._coefs[key]
         else:
             return 0
     
@@ -93,117 +498,301 @@ class Polynomial:
     #   the coefficient
     #  @param value The value set at given index
     def __setitem__(self, key: int, value: int) -> None:
-        if np.abs(value) >= self.__base:
+        if not -self._base < value < self._base:
             raise ValueError("The set value must be modulo base!")
         
-        if key <= self.__deg:
-            self.__coefs[key] = value
-        else:
-            self.__coefs += [0] * (key - self.__deg)
-            self.__coefs[key] = value 
-            self.__deg = key - 1
-            self.__lc = value
+        if key <= self._deg:
+            self._coefs[key] = value
+
+            if key == self._deg and value == 0:
+                # The leading coefficient was removed so the degree has to be searched again
+                nonzero = np.flatnonzero(self._coefs)
+                self._deg = int(nonzero[-1]) if nonzero.size > 0 else 0
+                self._coefs = self._coefs[:self._deg + 1]
+                self._lc = self._coefs[self._deg]
+            elif key == self._deg:
+                self._lc = value
+        elif value != 0:
+            new_coefs = np.zeros(key + 1, dtype=np.int64)
+            new_coefs[:len(self._coefs)] = self._coefs
+            new_coefs[key] = value
+
+            self._coefs = new_coefs
+            self._deg = key
+            self._lc = value
+
+        # Invalidate the cached hash
+        self.__hash = None
+
+
+    ## Degree of the sum or difference with another polynomial if it is known without 
+    #  looking at the coefficients, that is if the degrees differ. Otherwise None
+    def _sum_deg(self, other: Polynomial) -> int | None:
+        return max(self._deg, other._deg) if self._deg != other._deg else None
+
+
+    ## Degree of the product with another polynomial if it is known without looking at 
+    #  the coefficients, that is if the product of the leading coefficients is not
+    #  divisible by the base. Otherwise None
+    def _product_deg(self, other: Polynomial) -> int | None:
+        return self._deg + other._deg if (self._lc * other._lc) % self._base != 0 else None
 
 
     @check_objects
     def __eq__(self, other: Polynomial) -> bool:
-        return self.__coefs == other.coefs() and self.__base == other.base()
+        return self._base == other._base and np.array_equal(self._coefs, other._coefs)
 
 
     @check_objects
     def __add__(self, other: Polynomial) -> Polynomial:
-        new_len = max(self.__deg, other.deg()) + 1
-        new_coefs = [0] * new_len
-        carries = [0] * (new_len + 1)
+        new_len = max(self._deg, other._deg) + 1
+        new_deg = self._sum_deg(other)
+
+        a = np.pad(self._coefs, (0, new_len - len(self._coefs)))
+        b = np.pad(other._coefs, (0, new_len - len(other._coefs)))
 
-        for i in range(new_len):
-            new_coefs[i] = (self[i] + other[i]) % self.__base
-            carries[i + 1] = (self[i] + other[i]) // self.__base
+        carries, new_coefs = np.divmod(a + b, self._base)
+        carries = np.concatenate(([0], carries))
 
-        return Polynomial(new_coefs, base=self.__base, carries=carries)
+        return Polynomial(new_coefs, base=self._base, carries=carries, deg=new_deg)
     
 
     @check_objects
     def __sub__(self, other: Polynomial) -> Polynomial:
-        new_len = max(self.__deg, other.deg()) + 1
-        new_coefs = [0] * new_len
-        carries = [0] * (new_len + 2)
+        new_len = max(self._deg, other._deg) + 1
+        new_deg = self._sum_deg(other)
 
-        for i in range(new_len):
-            new_coefs[i] = (self[i] - other[i]) % self.__base
-            carries[i + 1] = (self[i] - other[i]) // self.__base
+        a = np.pad(self._coefs, (0, new_len - len(self._coefs)))
+        b = np.pad(other._coefs, (0, new_len - len(other._coefs)))
 
-        return Polynomial(new_coefs, base=self.__base, carries=carries)
+        # Numpy floor division and modulo follow the Python semantics for negative values
+        carries, new_coefs = np.divmod(a - b, self._base)
+        carries = np.concatenate(([0], carries))
+
+        return Polynomial(new_coefs, base=self._base, carries=carries, deg=new_deg)
 
 
     @check_objects
     def __mul__(self, other: Polynomial) -> Polynomial:
-        # While the near linear time algorithm for multiplication is not implemented
-        # use the quadratic time one
-        return self._slow_mul(other)
+        # For large polynomials use the fast Fourier transform if the coefficients of the
+        # product can be represented exactly in double precision and the exact 
+        # number-theoretic transform otherwise. Smaller polynomials (or ones too large
+        # for either transform) fall back to the sub-quadratic Karatsuba algorithm
+        new_deg = self._deg + other._deg
+        bound = (new_deg + 1) * (self._base - 1) ** 2
+        
+        if new_deg > _FFT_THRESHOLD:
+            # The rounding error of the transform grows as (base - 1)^2 * n * log2(n) * 2^-53 
+            # for transform length n. Keep it below 2^-5 so that rounding is always exact
+            n_bits = int(new_deg).bit_length()
+            if (self._base - 1) ** 2 * (1 << n_bits) * n_bits < 2 ** 48:
+                return self._fft_mul(other)
+            
+            if new_deg > _NTT_THRESHOLD and bound < 2 ** 62 and new_deg < _NTT_MAX_LEN:
+                return self._ntt_mul(other)
+        
+        return self._karatsuba_mul(other)
 
 
-    ## Slow O((n + m)^2) implementation of polynomial multiplication. Used for debugging
+    ## O((n + m) log(n + m)) implementation of polynomial multiplication using the 
+    #  number-theoretic transform over three primes. Exact as long as the coefficients of 
+    #  the product are less than 2^62 in absolute value
     @check_objects
-    def _slow_mul(self, other: Polynomial) -> Polynomial:
-        new_len = self.__deg + other.deg() + 1
-        new_coefs = [0] * new_len
-        carries = [0] * (new_len + 1)
+    def _ntt_mul(self, other: Polynomial) -> Polynomial:
+        bound = min(len(self._coefs), len(other._coefs)) * (self._base - 1) ** 2
+        full = _ntt_convolve(self._coefs, other._coefs, bound)
+
+        carries, new_coefs = np.divmod(full, self._base)
+        carries = np.concatenate(([0], carries))
+
+        return Polynomial(new_coefs, base=self._base, carries=carries, deg=self._product_deg(other))
+
+
+    ## O((n + m) log(n + m)) implementation of polynomial multiplication using the fast
+    #  Fourier transform. Exact only if (base - 1)^2 * n * log2(n) is well below 2^53 for 
+    #  the transform length n
+    @check_objects
+    def _fft_mul(self, other: Polynomial) -> Polynomial:
+        new_len = len(self._coefs) + len(other._coefs) - 1
+        n = 1 << (new_len - 1).bit_length()
+
+        a = np.fft.rfft(self._coefs, n)
+        b = np.fft.rfft(other._coefs, n)
+        full = np.rint(np.fft.irfft(a * b, n)[:new_len]).astype(np.int64)
+
+        carries, new_coefs = np.divmod(full, self._base)
+        carries = np.concatenate(([0], carries))
+
+        return Polynomial(new_coefs, base=self._base, carries=carries, deg=self._product_deg(other))
+
+
+    ## O((n + m)^1.585) implementation of polynomial multiplication using the Karatsuba algorithm.
+    #  If the lengths differ, the longer operand is split into blocks of the length of the shorter
+    #  one so that the shorter operand is never padded. If the shorter operand is below the 
+    #  Karatsuba threshold the fused schoolbook kernel of _slow_mul is used instead
+    @check_objects
+    def _karatsuba_mul(self, other: Polynomial) -> Polynomial:
+        if min(len(self._coefs), len(other._coefs)) <= _KARATSUBA_THRESHOLD:
+            return self._slow_mul(other)
+
+        if len(self._coefs) >= len(other._coefs):
+            long, short = self._coefs, other._coefs
+        else:
+            long, short = other._coefs, self._coefs
+
+        n, m = len(long), len(short)
+        full = np.zeros(n + m - 1, dtype=np.int64)
+
+        block = np.zeros(m, dtype=np.int64)
+        prod = np.empty(2 * m - 1, dtype=np.int64)
+        scratch = np.empty(_karatsuba_scratch_size(m), dtype=np.int64)
 
-        for i in range(new_len):
-            coef = 0
+        for start in range(0, n, m):
+            chunk = long[start:start + m]
+            block[:len(chunk)] = chunk
+            block[len(chunk):] = 0
 
-            for j in range(i):
-                coef += self[j] * other[i - j]
+            _karatsuba(block, short, prod, scratch)
 
-            new_coefs[i] = coef % self.__base
-            carries[i + 1] = coef // self.__base
+            end = min(start + 2 * m - 1, n + m - 1)
+            full[start:end] += prod[:end - start]
 
-        return Polynomial(new_coefs, base=self.__base, carries=carries)
+        new_coefs = full % self._base
+        carries = np.concatenate(([0], full // self._base))
+
+        return Polynomial(new_coefs, base=self._base, carries=carries, deg=self._product_deg(other))
+
+
+    ## Quadratic time implementation of polynomial multiplication. Used by _karatsuba_mul for
+    #  small or unbalanced products
+    @check_objects
+    def _slow_mul(self, other: Polynomial) -> Polynomial:
+        new_len = len(self._coefs) + len(other._coefs) - 1
+        new_coefs = np.empty(new_len, dtype=np.int64)
+        carries = np.zeros(new_len + 1, dtype=np.int64)
+
+        _mul_schoolbook(self._coefs, other._coefs, self._base, new_coefs, carries)
+
+        return Polynomial(new_coefs, base=self._base, carries=carries, deg=self._product_deg(other))
 
 
     @check_objects
     def __truediv__(self, other: Polynomial) -> tuple[Polynomial, Polynomial]:
         # While the near linear time algorithm for division is not implemented
-        # use the quadratic time one
+        # use the quadratic time one. Binary polynomials are divided as packed bit vectors
+        if self._base == 2:
+            return self._gf2_div(other)
+        
         return self._slow_div(other)
 
 
-    ## Slow O((n + m)^2) implementation of polynomial division. Used for debugging
+    ## O((n + m)^2 / 64) implementation of polynomial division for binary polynomials
+    #  @exception ValueError Raises a ValueError if the divisor is the zero polynomial
+    @check_objects
+    def _gf2_div(self, other: Polynomial) -> tuple[Polynomial, Polynomial]:
+        if other._lc == 0:
+            raise ValueError("Division by the zero polynomial!")
+
+        n, m = len(self._coefs), len(other._coefs)
+
+        if n < m:
+            return Polynomial([0], base=self._base), Polynomial(self._coefs.copy(), base=self._base)
+
+        q, r = _gf2_div(_gf2_pack(self._coefs), n, _gf2_pack(other._coefs), m)
+
+        return (Polynomial(_gf2_unpack(q, n - m + 1), base=self._base, deg=n - m), 
+                Polynomial(_gf2_unpack(r, m - 1), base=self._base))
+
+
+    ## Quadratic time implementation of polynomial division. Used by __truediv__ for every
+    #  base except 2, which is handled by _gf2_div
     @check_objects
     def _slow_div(self, other: Polynomial) -> tuple[Polynomial, Polynomial]:
-        q, q_upd = Polynomial([0], base=self.__base), None
-        r, r_upd = self.copy(), None
+        inv_lc_b = unit_inv(other._lc, self._base)
 
-        inv_lc_b = unit_inv(other.lc(), self.__base)
+        q, r = _div_schoolbook(self._coefs, other._coefs, self._base, inv_lc_b)
 
-        deg_r, deg_b = r.deg(), other.deg()
+        # The leading coefficient of the quotient is a unit times a non-zero coefficient
+        q_deg = self._deg - other._deg if self._deg >= other._deg else None
 
-        i = 0
-        while deg_r >= deg_b:
+        return Polynomial(q, base=self._base, deg=q_deg), Polynomial(r, base=self._base)
 
-            if i != 0:
-                q, r = q_upd, r_upd
 
-            tmp = Polynomial([0] * (deg_r - deg_b) + [r.lc() * inv_lc_b], base=self.__base)
+    ## Sum of multiple polynomials at once. The coefficient arrays are stacked into a single
+    #  2-D array that is summed column-wise, so the work is done in one pass instead of one
+    #  addition per polynomial. The carries are those of the full sum
+    #  @param polys The polynomials to be summed. All should have the same base
+    @classmethod
+    def batch_add(cls, polys: list[Polynomial]) -> Polynomial:
+        assert len(polys) > 0, "At least one polynomial must be given!"
+        base = polys[0]._base
+        assert all(poly._base == base for poly in polys), "The bases must match!"
 
-            q_upd = q + tmp
-            r_upd = r - tmp * other
+        stacked = np.zeros((len(polys), max(len(poly._coefs) for poly in polys)), dtype=np.int64)
+        for i, poly in enumerate(polys):
+            stacked[i, :len(poly._coefs)] = poly._coefs
 
-            deg_r = r_upd.deg()
-            i += 1
+        carries, new_coefs = np.divmod(np.add.reduce(stacked, axis=0), base)
+        carries = np.concatenate(([0], carries))
 
-        return q, r
+        return cls(new_coefs, base=base, carries=carries)
+
+
+    ## Product of multiple polynomials at once. If the coefficients of the full product 
+    #  can be represented exactly in double precision, the Fourier transforms of all of the
+    #  polynomials are computed together and multiplied pointwise and the carries are those
+    #  of the full product. Otherwise the polynomials are multiplied pairwise, in which case 
+    #  the carries of the full product are not available and are left unset
+    #  @param polys The polynomials to be multiplied. All should have the same base
+    @classmethod
+    def batch_mul(cls, polys: list[Polynomial]) -> Polynomial:
+        assert len(polys) > 0, "At least one polynomial must be given!"
+        base = polys[0]._base
+        assert all(poly._base == base for poly in polys), "The bases must match!"
+
+        lens = [len(poly._coefs) for poly in polys]
+        new_len = sum(lens) - len(polys) + 1
+
+        n = 1 << (new_len - 1).bit_length()
+
+        # As in __mul__, leave room for the rounding error of the transforms
+        if math.prod(lens) * (base - 1) ** len(polys) * n * max(n.bit_length(), 1) >= 2 ** 48:
+            prod = functools.reduce(operator.mul, polys)
+
+            # A single polynomial is returned as is by reduce so its array has to be copied
+            coefs = prod._coefs if len(polys) > 1 else prod.coefs()
+
+            return cls(coefs, base=base, deg=prod._deg)
+
+        stacked = np.zeros((len(polys), max(lens)), dtype=np.int64)
+        for i, poly in enumerate(polys):
+            stacked[i, :len(poly._coefs)] = poly._coefs
+
+        spectrum = np.prod(np.fft.rfft(stacked, n, axis=1), axis=0)
+        full = np.rint(np.fft.irfft(spectrum, n)[:new_len]).astype(np.int64)
+
+        carries, new_coefs = np.divmod(full, base)
+        carries = np.concatenate(([0], carries))
+
+        return cls(new_coefs, base=base, carries=carries)
 
 
     ## Returns a copy of the coefficient array
     def coefs(self) -> np.ndarray[np.int64]:
-        return self.__coefs.copy()
+        return self._coefs.copy()
+    
+
+    ## Returns a read-only view of the coefficient array. Cheaper than coefs() as nothing is copied
+    def coefs_view(self) -> np.ndarray[np.int64]:
+        view = self._coefs.view()
+        view.setflags(write=False)
+
+        return view
     
 
     ## Returns the base
     def base(self) -> int:
-        return self.__base
+        return self._base
     
 
     ## Set the carries that resulted from e.g. addition an are required by the Integer and Radix classes
@@ -212,7 +801,7 @@ class Polynomial:
     #   coincide with the powers of the polynomial variable
     @check_array
     def set_carries(self, carries: np.ndarray[np.int64]) -> None:
-        self.__carries = carries
+        self.__carries = np.ascontiguousarray(carries, dtype=np.int64)
 
 
     ## Access the carries if set
@@ -231,10 +820,10 @@ class Polynomial:
 
     ## Returns the leading coefficient
     def lc(self) -> int:
-        return self.__lc
+        return self._lc
 
 
     ## Returns the degree of the polynomial
     def deg(self) -> int:
-        return self.__deg
+        return self._deg
     
\ No newline at end of file
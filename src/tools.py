@@ -4,6 +4,7 @@
 from collections.abc import Callable
 from typing import Any
 import numpy as np
+from numba import njit
 
 
 ## Decorator that checks that the two objects are valid for computations
@@ -11,13 +12,15 @@ import numpy as np
 #  object is the second positional argument
 def check_objects(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
     def check_objects_wrapper(*args, **kwargs):
-        this = args[0]
-        that = args[1]
+        # The checks are skipped when Python is ran with the -O flag
+        if __debug__:
+            this = args[0]
+            that = args[1]
 
-        assert isinstance(that, type(this)), f"The types of the objects must match! ({type(this)} != {type(that)})"
-        assert that.base() == this.base(), f"The bases must match! ({this.base()} != {that.base()})"
+            assert isinstance(that, type(this)), f"The types of the objects must match! ({type(this)} != {type(that)})"
+            assert that._base == this._base, f"The bases must match! ({this._base} != {that._base})"
 
-        return func(*args, *kwargs)
+        return func(*args, **kwargs)
 
     return check_objects_wrapper
 
@@ -28,15 +31,20 @@ def check_objects(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
 #  argument or it is retrieved from the self argument
 def check_array(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
     def check_array_wrapper(*args, **kwargs):
-        array = np.array(args[1])
-        
-        if "base" not in kwargs:
-            base = args[0].base()
-        else:
-            base = kwargs["base"]
-
-        assert array.dtype == np.int32 or array.dtype == np.int64, f"Coefficients must be integers! (type: {array.dtype})"
-        assert (np.abs(array) < base).all(), "Coefficients must less than the base!"
+        # The checks are skipped when Python is ran with the -O flag
+        if __debug__:
+            array = args[1] if isinstance(args[1], np.ndarray) else np.asarray(args[1])
+            
+            if "base" not in kwargs:
+                base = args[0]._base
+            else:
+                base = kwargs["base"]
+
+            assert array.dtype == np.int32 or array.dtype == np.int64, f"Coefficients must be integers! (type: {array.dtype})"
+            assert array.ndim == 1, f"Coefficients must be given as a 1-D array! (dimensions: {array.ndim})"
+            # Two reductions instead of np.abs so that no temporary arrays are allocated
+            lo, hi = array.min(initial=0), array.max(initial=0)
+            assert -base < lo and hi < base, "Coefficients must less than the base!"
 
         return func(*args, **kwargs)
 
@@ -44,23 +52,55 @@ def check_array(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
 
 
 ## Function for computing the inverse of a unit in some ring Z_b using 
-#  the adapted Euclidean algorithm
+#  the adapted Euclidean algorithm. Moduli that fit into a machine word are handled
+#  by a compiled kernel and larger ones by GMP through gmpy2 (imported only when needed)
 #  @exception ValueError Raises ValueError if unit is not invertible (is not a unit)
 #  @param unit The unit of which inverse is computed
 #  @param b The modulo respect to which the ring is defined
 def unit_inv(unit: int, b: int) -> int:
-    t, t_upd = 0, 1
-    r, r_upd = b, unit
+    unit = unit % b
+
+    if int(b).bit_length() >= 62:
+        from gmpy2 import invert
+
+        try:
+            return int(invert(int(unit), int(b)))
+        except ZeroDivisionError:
+            raise ValueError("Passed unit is not invertible!")
+
+    t, r = _unit_inv(unit, b)
+
+    if abs(r) != 1:
+        raise ValueError("Passed unit is not invertible!")
+
+    return t
+
+
+## Compiled kernel of the adapted Euclidean algorithm used by unit_inv. Only
+#  valid for moduli less than 2^62 so that the intermediate values fit into 
+#  64-bit integers
+#  @param unit The unit of which inverse is computed
+#  @param b The modulo respect to which the ring is defined
+#  @return Tuple of the inverse and the greatest common divisor of unit and b
+@njit(cache=True)
+def _unit_inv(unit: int, b: int) -> tuple[int, int]:
+    t = 0
+    t_upd = 1
+    r = b
+    r_upd = unit
 
     while r_upd != 0:
         quo = r // r_upd
 
-        t, t_upd = t_upd, t - quo * t_upd
-        r, r_upd = r_upd, r - quo * r_upd
+        tmp = t - quo * t_upd
+        t = t_upd
+        t_upd = tmp
+
+        tmp = r - quo * r_upd
+        r = r_upd
+        r_upd = tmp
 
-    if r > 1:
-        raise ValueError("Passed unit is not invertible!")
     if t < 0:
         t += b
 
-    return t
+    return t, r
@@ -0,0 +1,197 @@
+import pytest
+import numpy as np
+from polynomial import Polynomial
+
+
+def test_mul_uses_exact_fft_for_large_products(monkeypatch):
+    rng = np.random.default_rng(2)
+    a = rng.integers(0, 10, 1000)
+    b = rng.integers(0, 10, 900)
+    a[-1], b[-1] = 1, 1
+
+    calls = []
+    fft_mul = Polynomial._fft_mul
+    monkeypatch.setattr(Polynomial, "_fft_mul", lambda self, other: calls.append(1) or fft_mul(self, other))
+
+    prod = Polynomial(a, base=10) * Polynomial(b, base=10)
+    full = np.convolve(a.astype(object), b.astype(object))
+
+    assert calls
+    assert np.array_equal(prod.coefs(), (full % 10).astype(np.int64))
+    assert np.array_equal(prod.get_carries()[1:], (full // 10).astype(np.int64))
+
+
+def test_mul_worst_case_coefficients_exact():
+    base = 2 ** 20
+    p = Polynomial(np.full(3000, base - 1), base=base)
+
+    prod = p * p
+    expected = p._karatsuba_mul(p)
+
+    assert prod == expected
+    assert np.array_equal(prod.get_carries(), expected.get_carries())
+
+
+@pytest.mark.parametrize("base", [2, 7, 10])
+def test_div_by_zero_raises(base):
+    with pytest.raises(ValueError):
+        Polynomial([1, 0, 1], base=base) / Polynomial([0], base=base)
+
+
+@pytest.mark.parametrize("n, m", [(63, 2), (64, 63), (65, 64), (128, 65), (129, 129), (129, 1), (200, 129), (64, 100)])
+def test_gf2_div_matches_slow_div(n, m):
+    rng = np.random.default_rng(n * m)
+    a = rng.integers(-1, 2, n)
+    b = rng.integers(-1, 2, m)
+    a[-1], b[-1] = -1, 1
+
+    p, q = Polynomial(a, base=2), Polynomial(b, base=2)
+
+    for fast, slow in zip(p / q, p._slow_div(q)):
+        assert fast == slow
+        assert fast.deg() == slow.deg() and fast.lc() == slow.lc()
+
+
+def test_constructor_copies_the_coefficients():
+    a = np.array([1, 2, 3])
+    p = Polynomial(a, base=10)
+
+    p[0] = 7
+    assert np.array_equal(a, [1, 2, 3])
+
+    a[1] = 5
+    assert p == Polynomial([7, 2, 3], base=10)
+
+    q = Polynomial(p.coefs_view(), base=10)
+    q[0] = 1
+    assert q == Polynomial([1, 2, 3], base=10)
+
+
+def test_setting_leading_coefficient_to_zero_lowers_degree():
+    p = Polynomial([1, 2, 3], base=10)
+    p[2] = 0
+
+    assert p.deg() == 1 and p.lc() == 2
+    assert p == Polynomial([1, 2], base=10)
+    assert (p + Polynomial([5], base=10)).lc() == 2
+
+    p[1] = 0
+    p[0] = 0
+    assert p.deg() == 0 and p.lc() == 0
+    assert p == Polynomial([0], base=10)
+
+
+def test_ntt_mul_matches_karatsuba():
+    rng = np.random.default_rng(0)
+
+    for base, n, m in ((10, 700, 600), (10 ** 6, 2000, 1500), (2 ** 20, 3000, 3000), (2 ** 20, 5, 3)):
+        a = rng.integers(-base + 1, base, n)
+        b = rng.integers(-base + 1, base, m)
+        a[-1], b[-1] = 1, base - 1
+
+        p, q = Polynomial(a, base=base), Polynomial(b, base=base)
+        prod = p._ntt_mul(q)
+        expected = p._karatsuba_mul(q)
+
+        assert prod == expected
+        assert np.array_equal(prod.get_carries(), expected.get_carries())
+
+
+def test_karatsuba_mul_unbalanced():
+    rng = np.random.default_rng(1)
+
+    for n, m in ((500, 1), (500, 48), (500, 49), (1000, 130), (97, 96)):
+        a = rng.integers(0, 10, n)
+        b = rng.integers(0, 10, m)
+        a[-1], b[-1] = 1, 1
+
+        p, q = Polynomial(a, base=10), Polynomial(b, base=10)
+        full = np.convolve(a, b)
+
+        for prod in (p._karatsuba_mul(q), q._karatsuba_mul(p)):
+            assert np.array_equal(prod.coefs(), full % 10)
+            assert np.array_equal(prod.get_carries()[1:], full // 10)
+
+
+def test_batch_mul_carries():
+    small = [Polynomial([1, 2, 3], base=10), Polynomial([4, 5], base=10), Polynomial([6, 7, 9], base=10)]
+    prod = Polynomial.batch_mul(small)
+    full = np.convolve(np.convolve([1, 2, 3], [4, 5]), [6, 7, 9])
+
+    assert np.array_equal(prod.coefs(), full % 10)
+    assert np.array_equal(prod.get_carries()[1:], full // 10)
+
+    base = 2 ** 20
+    large = [Polynomial(np.full(100, base - 1), base=base) for _ in range(3)]
+    prod = Polynomial.batch_mul(large)
+
+    assert prod == large[0] * large[1] * large[2]
+    with pytest.raises(RuntimeError):
+        prod.get_carries()
+
+
+def test_setitem_extends_coefficients():
+    p = Polynomial([1, 2, 3], base=10)
+    hash(p)
+    p[5] = 4
+
+    expected = Polynomial([1, 2, 3, 0, 0, 4], base=10)
+    assert np.array_equal(p.coefs(), [1, 2, 3, 0, 0, 4])
+    assert p.deg() == 5 and p.lc() == 4
+    assert p == expected and hash(p) == hash(expected)
+
+
+@pytest.mark.skipif(not __debug__, reason="The checks are skipped with python -O")
+def test_known_degree_is_checked():
+    with pytest.raises(AssertionError):
+        Polynomial(np.array([1, 2, 0, 0]), base=10, deg=3)
+
+    with pytest.raises(AssertionError):
+        Polynomial(np.array([1, 2]), base=10, deg=2)
+
+    assert Polynomial(np.array([1, 2, 0]), base=10, deg=1) == Polynomial([1, 2], base=10)
+
+
+def test_degree_is_python_int():
+    p = Polynomial([1, 2, 3, 0], base=10)
+    assert type(p.deg()) is int and type((p * p).deg()) is int
+
+    p[2] = 0
+    assert type(p.deg()) is int
+
+
+def test_batch_add_matches_chained_add():
+    rng = np.random.default_rng(3)
+    polys = []
+    for n in (5, 40, 17, 1):
+        a = rng.integers(0, 10, n)
+        a[-1] = 1
+        polys.append(Polynomial(a, base=10))
+
+    total = Polynomial.batch_add(polys)
+    chained = polys[0] + polys[1] + polys[2] + polys[3]
+    column_sum = sum(np.pad(poly.coefs(), (0, 40 - len(poly.coefs()))) for poly in polys)
+
+    assert total == chained
+    assert np.array_equal(total.get_carries(), np.concatenate(([0], column_sum // 10)))
+
+    pair = Polynomial.batch_add(polys[:2])
+    assert pair == polys[0] + polys[1]
+    assert np.array_equal(pair.get_carries(), (polys[0] + polys[1]).get_carries())
+
+
+def test_eq_with_unequal_lengths():
+    p = Polynomial([1, 2, 3], base=10)
+
+    assert not p == Polynomial([1, 2], base=10)
+    assert not p == Polynomial([1, 2, 3, 4], base=10)
+    assert p == Polynomial([1, 2, 3, 0, 0], base=10)
+
+
+def test_coefs_view_is_read_only():
+    p = Polynomial([1, 2, 3], base=10)
+    view = p.coefs_view()
+
+    assert np.array_equal(view, [1, 2, 3])
+    with pytest.raises(ValueError):
+        view[0] = 5
@@ -0,0 +1,11 @@
+import pytest
+from tools import unit_inv
+
+
+def test_unit_inv_negative_units():
+    assert unit_inv(-3, 10) == 3
+    assert unit_inv(-3, 2 ** 127 - 1) * -3 % (2 ** 127 - 1) == 1
+
+    for unit, b in ((-2, 10), (0, 10), (2, 2 ** 100), (-2, 2 ** 100)):
+        with pytest.raises(ValueError):
+            unit_inv(unit, b)